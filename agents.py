@@ -3,39 +3,53 @@ TutoBot Agent System (Refactored)
 Multi-agent orchestration with evaluation loops and explicit session management
 """
 
+import os
 import json
+import uuid
 import asyncio
+import logging
 from typing import Dict, List, Any, Optional
-from google.adk.agents import Agent, SequentialAgent, LoopAgent
-from google.adk.runners import Runner
-from google.adk.apps.app import App
-from google.adk.sessions import DatabaseSessionService, InMemorySessionService
-# from google.adk.tools import FunctionTool
-from google.adk.models.google_llm import Gemini
-from google.genai import types
 
+# google.adk / google.genai / googleapiclient (via tools) are imported lazily
+# inside the methods that need them — they cost seconds of cold start, which
+# callers that never build a TutoBot (e.g. a connector run that finds no
+# pending rows) shouldn't pay
+
+from json_stream import StreamingJsonParser
 from prompts import get_prompt
-from tools import (
-    sheets_read, sheets_write, sheets_append,
-    search_ncert_content, create_google_doc, create_google_form,
-    get_all_tools
-)
 
 # ========== Configuration ==========
 # MODEL_ID = "gemini-2.5-flash-lite"
 MODEL_ID = "gemini-2.5-flash"
+EVAL_MODEL_ID = "gemini-2.5-flash-lite"
 QUALITY_THRESHOLD = 70  # Minimum quality score for approval
 
-# ========== TutoBot Orchestrator ==========
+# Lazy %-style logging instead of print: string building is skipped when the
+# level is off, and handlers can be made non-blocking (QueueHandler) when many
+# pipeline tasks log concurrently
+log = logging.getLogger("tutobot")
 
-def parse_json(text):
-    txt_start = text.find('```') + 3
-    txt_end = text.find('```', txt_start)
-    text = text[txt_start:txt_end+1]
-    json_str = text[text.find('{'):text.rfind('}')+1] # get json
-    # json_str = ''.join(c for c in json_str if ord(c) >= 32 or c in '\n\r').replace('\u2011', '-') # clean chars
-    # json_str = ' '.join(json_str.split())
-    return json.loads(json_str.strip())
+# Agent roster: (key, name, description, tool names, output_key). The
+# evaluator is the only agent that runs on the dedicated eval model.
+AGENT_SPECS = [
+    ("planner", "CurriculumPlanner",
+        "Plans multi-week curriculum aligned with Indian education boards",
+        ["search_ncert_content", "sheets_write"], "curriculum"),
+    ("lesson", "LessonDesigner",
+        "Creates detailed daily lesson plans with activities",
+        ["sheets_read", "search_ncert_content", "create_google_doc", "sheets_append"], "lessons"),
+    ("assessment", "AssessmentCreator",
+        "Generates quizzes and tests with auto-grading",
+        ["sheets_read", "create_google_form", "sheets_append"], "assessments"),
+    ("evaluator", "QualityEvaluator",
+        "Validates content quality and alignment with objectives",
+        [], "evaluation"),
+    ("export", "DocumentExporter",
+        "Formats and organizes final materials",
+        ["sheets_read", "create_google_doc", "sheets_write"], "final_summary"),
+]
+
+# ========== TutoBot Orchestrator ==========
 
 class TutoBot:
     """
@@ -51,94 +65,67 @@ class TutoBot:
             spreadsheet_id: Google Sheets ID for state storage
             service_account_file: Path to service account JSON
         """
+        from google.adk.models.google_llm import Gemini
+        from google.adk.sessions import InMemorySessionService
+        from google.genai import types
+
         self.folder_id = folder_id
         self.spreadsheet_id = spreadsheet_id
         self.service_account_file = service_account_file
         
         retry_cfg = types.HttpRetryOptions(attempts=5, exp_base=7, initial_delay=1, http_status_codes=[429, 500, 503, 504])
         self.model = Gemini(model=MODEL_ID, temperature=0.9, top_p=0.95, retry_options=retry_cfg)
+
+        # Constrained JSON scoring doesn't need full flash capacity, and the
+        # evaluator runs as often as every generator — the lite model cuts its
+        # latency and token cost, and the low temperature keeps the verdict
+        # JSON deterministic
+        self.eval_model = Gemini(model=EVAL_MODEL_ID, temperature=0.2, top_p=0.8, retry_options=retry_cfg)
         
         # self.session_service = DatabaseSessionService(connection_string=f'sqlite:///tutobot_sessions.db')
         self.session_service = InMemorySessionService()
+
+        # Bound in-flight Gemini calls across all gather fan-outs so parallel
+        # weeks/agents stay under quota instead of tripping the 429 retry path
+        self._llm_sem = asyncio.Semaphore(int(os.getenv("TUTOBOT_CONCURRENCY", "4")))
+
+        # Session objects keyed by (app_name, session_id) so repeat calls on a
+        # stable session skip the get/create round-trips
+        self._session_cache = {}
+
+        # Pre-serialized shared sub-objects: key -> (source object, JSON string)
+        self._encoded = {}
         
         self.tools = self._create_tools()
+        self._prompt_cache = {name: get_prompt(name) for name in ('planner', 'lesson', 'assessment', 'evaluator', 'export')}
         self.agents = self._create_agents()
         self.runners = self._create_runners()
     
     def _create_tools(self) -> Dict[str, Any]:
         """Create all tool instances"""
+        from tools import get_all_tools
         return {tool.name: tool for tool in get_all_tools()}
-    
-    def _create_agents(self) -> Dict[str, Agent]:
-        """Create all agent instances"""
+
+    def _create_agents(self) -> Dict[str, Any]:
+        """Create all agent instances from the declarative spec"""
+        from google.adk.agents import Agent
+
         agents = {}
-        base_config = {'model': self.model}
-        
-        # === PLANNER AGENT ===
-        agents['planner'] = Agent(name="CurriculumPlanner",
-            description="Plans multi-week curriculum aligned with Indian education boards",
-            instruction=get_prompt('planner'),
-            tools=[
-                self.tools['search_ncert_content'],
-                self.tools['sheets_write']
-            ],
-            output_key="curriculum",
-            **base_config
-        )
-        
-        # === LESSON AGENT ===
-        agents['lesson'] = Agent(name="LessonDesigner",
-            description="Creates detailed daily lesson plans with activities",
-            instruction=get_prompt('lesson'),
-            tools=[
-                self.tools['sheets_read'],
-                self.tools['search_ncert_content'],
-                self.tools['create_google_doc'],
-                self.tools['sheets_append']
-            ],
-            output_key="lessons",
-            **base_config
-        )
-        
-        # === ASSESSMENT AGENT ===
-        agents['assessment'] = Agent(name="AssessmentCreator",
-            description="Generates quizzes and tests with auto-grading",
-            instruction=get_prompt('assessment'),
-            tools=[
-                self.tools['sheets_read'],
-                self.tools['create_google_form'],
-                self.tools['sheets_append']
-            ],
-            output_key="assessments",
-            **base_config
-        )
-        
-        # === EVALUATOR AGENT ===
-        agents['evaluator'] = Agent(name="QualityEvaluator",
-            description="Validates content quality and alignment with objectives",
-            instruction=get_prompt('evaluator'),
-            tools=[],
-            output_key="evaluation",
-            **base_config
-        )
-        
-        # === EXPORT AGENT ===
-        agents['export'] = Agent(name="DocumentExporter",
-            description="Formats and organizes final materials",
-            instruction=get_prompt('export'),
-            tools=[
-                self.tools['sheets_read'],
-                self.tools['create_google_doc'],
-                self.tools['sheets_write']
-            ],
-            output_key="final_summary",
-            **base_config
-        )
-        
+        for key, name, description, tool_names, output_key in AGENT_SPECS:
+            agents[key] = Agent(name=name,
+                description=description,
+                instruction=self._prompt_cache[key],
+                tools=[self.tools[tool_name] for tool_name in tool_names],
+                output_key=output_key,
+                model=self.eval_model if key == 'evaluator' else self.model
+            )
         return agents
     
-    def _create_runners(self) -> Dict[str, Runner]:
+    def _create_runners(self) -> Dict[str, Any]:
         """Create runners for each agent"""
+        from google.adk.apps.app import App
+        from google.adk.runners import Runner
+
         runners = {}
         for name, agent in self.agents.items():
             app = App(name=f"TutoBot_{name}", root_agent=agent)
@@ -146,19 +133,60 @@ class TutoBot:
         return runners
     
     async def _get_or_create_session(self, app_name: str, session_id: str, user_id: str = "teacher_1"):
-        """Get existing session or create new one"""
+        """Get existing session or create new one (memoized per app/session pair)"""
+        cached = self._session_cache.get((app_name, session_id))
+        if cached is not None:
+            return cached
         try:
             session = await self.session_service.get_session(app_name=app_name, session_id=session_id, user_id=user_id)
             if session is None:
                 session = await self.session_service.create_session(app_name=app_name, session_id=session_id, user_id=user_id)
         except Exception as e:
             # If get_session raises an exception, try to create a new session
-            print(f"  Warning: get_session failed ({e}), creating new session...")
+            log.warning("get_session failed (%s), creating new session...", e)
             session = await self.session_service.create_session(app_name=app_name, session_id=session_id, user_id=user_id)
         if session is None:
             raise RuntimeError(f"Failed to get or create session for app_name={app_name}, session_id={session_id}")
+        self._session_cache[(app_name, session_id)] = session
         return session
+
+    async def _discard_session(self, agent_name: str, session_id: str, user_id: str = "teacher_1"):
+        """Delete a session and drop it from the cache"""
+        app_name = self.runners[agent_name].app_name
+        self._session_cache.pop((app_name, session_id), None)
+        try:
+            await self.session_service.delete_session(app_name=app_name, session_id=session_id, user_id=user_id)
+        except Exception as e:
+            log.warning("delete_session failed (%s)", e)
     
+    def _encode(self, key: str, obj: Any) -> str:
+        """Serialize obj once and cache the JSON string by key"""
+        cached = self._encoded.get(key)
+        if cached is not None and cached[0] is obj:
+            return cached[1]
+        encoded = json.dumps(obj, ensure_ascii=False)
+        self._encoded[key] = (obj, encoded)
+        return encoded
+
+    def _serialize_input(self, input_data: Dict[str, Any]) -> str:
+        """json.dumps that splices in cached sub-object encodings.
+
+        The curriculum is the biggest object in the pipeline and gets embedded
+        into every lesson and assessment input; when the cached object itself
+        is present (identity check), its pre-encoded string is concatenated in
+        instead of being re-serialized per call.
+        """
+        cached = self._encoded.get("curriculum")
+        curriculum = input_data.get("curriculum")
+        if cached is None or curriculum is not cached[0]:
+            return json.dumps(input_data, ensure_ascii=False)
+
+        rest = {k: v for k, v in input_data.items() if k != "curriculum"}
+        if not rest:
+            return '{"curriculum": ' + cached[1] + '}'
+        rest_json = json.dumps(rest, ensure_ascii=False)
+        return '{"curriculum": ' + cached[1] + ', ' + rest_json[1:]
+
     async def run_agent(self, agent_name: str, input_data: Dict[str, Any], session_id: Optional[str] = None) -> Dict[str, Any]:
         """
         Run a single agent with input data
@@ -166,121 +194,213 @@ class TutoBot:
         Args:
             agent_name: Name of agent to run
             input_data: Input data dictionary
-            session_id: Optional session ID (generated if not provided)
-            
+            session_id: Optional session ID (generated if not provided; generated
+                sessions are deleted again once the call returns)
+
         Returns:
             Agent output as dictionary
         """
-        if session_id is None:
-            session_id = f"{agent_name}_{id(input_data)}"
-        
+        from google.genai import types
+
+        # uuid4 instead of id(input_data): ids get reused after GC, which could
+        # collide two concurrent calls. Auto-generated sessions are one-shot.
+        ephemeral = session_id is None
+        if ephemeral:
+            session_id = f"{agent_name}_{uuid.uuid4().hex}"
+
         runner = self.runners[agent_name]
-        
+
         # Create or get session
         session = await self._get_or_create_session(app_name=runner.app_name, session_id=session_id)
-        
-        # Prepare message
-        content = types.Content(role='user', parts=[types.Part(text=json.dumps(input_data, ensure_ascii=False))])
-        
-        # Run agent and collect output
-        output_text = ""
-        async for event in runner.run_async(user_id="teacher_1", session_id=session.id, new_message=content):
-            if event.content and event.content.parts:
-            # if event.content and event.content.parts and event.is_final_response():
-                for part in event.content.parts:
-                    if part.text:
-                        output_text += part.text
-        
-        # Parse JSON output
+
+        # Prepare message (reuses pre-serialized shared sub-objects)
+        content = types.Content(role='user', parts=[types.Part(text=self._serialize_input(input_data))])
+
+        # Run agent and stream-parse the JSON output as chunks arrive
+        parser = StreamingJsonParser()
         try:
-            result = parse_json(output_text)
-            print(f" JSON OK: {str(result)[:200]}")
-        except json.JSONDecodeError as e:
-            print(f"??  JSON parse error for {agent_name}: {e}")
-            # print(f"Raw output: {output_text[:500]}")
-            print(f"Raw output: {output_text}")
-            result = {"error": "Failed to parse JSON", "raw_output": output_text}
-        
+            async with self._llm_sem:
+                async for event in runner.run_async(user_id="teacher_1", session_id=session.id, new_message=content):
+                    if event.content and event.content.parts:
+                    # if event.content and event.content.parts and event.is_final_response():
+                        for part in event.content.parts:
+                            if part.text:
+                                parser.consume(part.text)
+        finally:
+            # Keep InMemorySessionService O(concurrent-calls), not O(total-calls)
+            if ephemeral:
+                await self._discard_session(agent_name, session.id)
+
+        try:
+            result = parser.get()
+            log.info("JSON OK: %.200s", result)
+        except (ValueError, json.JSONDecodeError) as e:
+            # Capped preview only — dumping a 50KB raw payload to stdout would
+            # block every other task on the event loop for the flush. The full
+            # output is available at DEBUG level.
+            raw_output = parser.buffer
+            log.error("JSON parse error for %s: %s; raw[:2048]=%s", agent_name, e, raw_output[:2048])
+            log.debug("Full raw output for %s: %s", agent_name, raw_output)
+            result = {"error": "Failed to parse JSON", "raw_output": raw_output}
+
         return result
     
-    async def run_with_evaluation(self, generator_name: str, input_data: Dict[str, Any], content_type: str, max_iterations: int = 3) -> Dict[str, Any]:
+    async def run_with_evaluation(self, generator_name: str, input_data: Dict[str, Any], content_type: str, max_iterations: int = 3, session_id: Optional[str] = None) -> Dict[str, Any]:
         """
         Run a generator agent with a universal evaluation loop.
-        
+
         Args:
             generator_name: Name of generator agent
             input_data: Input data for generator
             content_type: Type for logging (e.g., curriculum/lesson)
             max_iterations: Maximum revision cycles
-            
+            session_id: Optional session ID for the generator (unique per concurrent task;
+                generated if not provided, and discarded once the loop ends)
+
         Returns:
             Final approved content
         """
-        print(f"\n{'='*60}")
-        print(f"Running {generator_name} with Universal Evaluation Loop")
-        print(f"{'='*60}")
-        
-        iteration = 0
+        log.info("Running %s with Universal Evaluation Loop", generator_name)
+
+        # One stable session for all revision iterations: the generator keeps
+        # its conversation context, so feedback rounds build on prior turns
+        # instead of re-ingesting everything cold
+        if session_id is None:
+            session_id = f"{generator_name}_{uuid.uuid4().hex}"
+
         current_input = input_data.copy()
-        content = None
-        evaluation = None
-        
+
         # Retrieve the original instruction of the generator
         original_instruction = self.agents[generator_name].instruction
-        
+
+        try:
+            return await self._evaluation_loop(generator_name, input_data, current_input, original_instruction, max_iterations, session_id)
+        finally:
+            await self._discard_session(generator_name, session_id)
+
+    @staticmethod
+    async def _cancel_task(task):
+        """Cancel a pending task and swallow the cancellation"""
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def _evaluation_loop(self, generator_name, input_data, current_input, original_instruction, max_iterations, session_id):
+        """Generate/evaluate/revise cycle used by run_with_evaluation"""
+        # One evaluator session per loop: the multi-KB instruction and inputs
+        # are sent once, later rounds reuse those tokens via session context
+        # and only ship the new output
+        eval_sid = f"evaluator_{generator_name}_{uuid.uuid4().hex}"
+
+        try:
+            return await self._evaluation_rounds(generator_name, input_data, current_input, original_instruction, max_iterations, session_id, eval_sid)
+        finally:
+            await self._discard_session("evaluator", eval_sid)
+
+    async def _evaluation_rounds(self, generator_name, input_data, current_input, original_instruction, max_iterations, session_id, eval_sid):
+        iteration = 0
+        content = None
+        evaluation = None
+        pending_result = None   # speculative draft carried into the next iteration
+        eval_primed = False
+
         while iteration < max_iterations:
             iteration += 1
-            print(f"\n--- Iteration {iteration} ---")
-            
-            # 1. Run Generator
-            print(f"  Generating content with {generator_name}...")
-            result = await self.run_agent(generator_name, current_input)
-            
+
+            # 1. Run Generator (or adopt the draft generated speculatively
+            # while the previous evaluation was still in flight)
+            if pending_result is not None:
+                log.info("[%s] iteration %d: using speculative draft", generator_name, iteration)
+                result = pending_result
+                pending_result = None
+            else:
+                log.info("[%s] iteration %d: generating content", generator_name, iteration)
+                result = await self.run_agent(generator_name, current_input, session_id=session_id)
+
             # Handle varied output keys (some agents return wrapped dicts, others might be direct)
             content = result.get(self.agents[generator_name].output_key, result)
-            
+
             # 2. Run Universal Evaluator
-            print(f"  Evaluating content...")
-            
-            # Prepare universal evaluator inputs
-            eval_input = {
-                "generator_name": generator_name,
-                "original_instruction": original_instruction,
-                "generator_inputs": input_data,
-                "generator_output": result
-            }
-            
-            eval_result = await self.run_agent("evaluator", eval_input)
+            log.info("[%s] iteration %d: evaluating content", generator_name, iteration)
+
+            # Prepare universal evaluator inputs — full static context only on
+            # the first round, deltas afterwards
+            if not eval_primed:
+                eval_input = {
+                    "generator_name": generator_name,
+                    "original_instruction": original_instruction,
+                    "generator_inputs": input_data,
+                    "generator_output": result
+                }
+            else:
+                eval_input = {
+                    "generator_output": result,
+                    "note": "Evaluate against the same generator_name, original_instruction and generator_inputs provided earlier in this session."
+                }
+
+            eval_task = asyncio.create_task(self.run_agent("evaluator", eval_input, session_id=eval_sid))
+            eval_primed = True
+
+            # Speculative re-generation: verdicts are usually APPROVED, so the
+            # next draft only costs idle quota — cancelled for free on approval,
+            # and saves one full generator latency on rejection. The draft runs
+            # without the evaluator's feedback (not known yet) and only when the
+            # semaphore has spare slots so it never doubles quota pressure.
+            speculative = None
+            if iteration < max_iterations and self._llm_sem._value > 0:
+                speculative = asyncio.create_task(self.run_agent(generator_name,
+                    {**current_input, "previous_feedback": "Revise and improve your previous answer."},
+                    session_id=session_id))
+
+            eval_result = await eval_task
             evaluation = eval_result.get("evaluation_result", eval_result)
-            
+
             status = evaluation.get("status", "REJECTED")
             score = evaluation.get("quality_score", 0)
             feedback = evaluation.get("feedback", "No feedback provided")
-            
-            print(f"  Quality Score: {score}/100")
-            print(f"  Status: {status}")
-            
+
+            log.info("[%s] quality score %s/100, status %s", generator_name, score, status)
+
             # 3. Check for Approval
             if status == "APPROVED":
-                print(f"  Content approved!")
+                await self._cancel_task(speculative)
+                log.info("[%s] content approved", generator_name)
                 return {"content": content, "evaluation": evaluation, "iterations": iteration}
-            
+
             # 4. Handle Rejection / Suggestions
             if iteration < max_iterations:
-                print(f"  !! Content not approved. Sending feedback to generator...")
-                print(f"  Feedback: {str(feedback)[:200]}...")
-                
+                log.info("[%s] not approved, sending feedback to generator: %.200s", generator_name, feedback)
+
                 # Integrate suggestions into the inputs for the next iteration
                 # We modify the structure of inputs to include the feedback
                 current_input["previous_feedback"] = feedback
+                if speculative is not None:
+                    pending_result = await speculative
             else:
-                print(f"  Feedback: {str(feedback)[:200]}...")
-                print(f"  !! Max iterations reached without full approval.")
+                await self._cancel_task(speculative)
+                log.warning("[%s] max iterations reached without approval; feedback: %.200s", generator_name, feedback)
                 return {"content": content, "evaluation": evaluation, "iterations": iteration,
                     "warning": "Max iterations reached without approval"}
-        
+
         return {"content": content, "evaluation": evaluation, "iterations": iteration}
     
+    async def _run_all_weeks(self, teacher_input: Dict[str, Any], curriculum: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Generate lessons for every week concurrently and return the flattened list"""
+        lesson_tasks = []
+        for week in curriculum[:2]:  # Limit to first 2 weeks for demo
+            week_num = week.get('week', 1)
+            lesson_input = {**teacher_input, 'curriculum': curriculum, 'week_number': week_num}
+
+            # Unique session per task so concurrent runs can't collide in InMemorySessionService
+            lesson_tasks.append(self.run_with_evaluation(generator_name="lesson", input_data=lesson_input, content_type="lesson",
+                max_iterations=2, session_id=f"lesson_w{week_num}_{uuid.uuid4().hex}"))
+
+        lesson_results = await asyncio.gather(*lesson_tasks)
+        return [lesson for week_result in lesson_results for lesson in week_result['content'].get('lessons', [])]
+
     async def run_full_pipeline(self, teacher_input: Dict[str, Any]) -> Dict[str, Any]:
         """
         Run complete TutoBot pipeline with evaluation loops
@@ -291,16 +411,9 @@ class TutoBot:
         Returns:
             Final output with all generated materials
         """
-        print(f"""
-==============================================================
-                   ?? TutoBot Pipeline                        
---------------------------------------------------------------
-  Board:     {teacher_input.get('board', 'N/A'):<48} 
-  Grade:     {teacher_input.get('grade', 'N/A'):<48} 
-  Subject:   {teacher_input.get('subject', 'N/A'):<48} 
-  Duration:  {teacher_input.get('duration_weeks', 'N/A')} weeks{' ' * (44 - len(str(teacher_input.get('duration_weeks', ''))))}
-==============================================================
-        """)
+        log.info("TutoBot Pipeline: board=%s grade=%s subject=%s duration=%s weeks",
+            teacher_input.get('board', 'N/A'), teacher_input.get('grade', 'N/A'),
+            teacher_input.get('subject', 'N/A'), teacher_input.get('duration_weeks', 'N/A'))
         
         # Add spreadsheet_id to input
         teacher_input['folder_id'] = self.folder_id
@@ -309,44 +422,31 @@ class TutoBot:
         results = {}
         
         # === STEP 1: Curriculum Planning with Evaluation ===
-        print("\n" + "="*60)
-        print("STEP 1: CURRICULUM PLANNING")
-        print("="*60)
+        log.info("STEP 1: CURRICULUM PLANNING")
         
         curriculum_result = await self.run_with_evaluation(generator_name="planner", input_data=teacher_input, content_type="curriculum", max_iterations=3)
         results['curriculum'] = curriculum_result
         
-        # === STEP 2: Lesson Design with Evaluation ===
-        print("\n" + "="*60)
-        print("STEP 2: LESSON DESIGN")
-        print("="*60)
-        
-        # Generate lessons for each week
+        # === STEP 2 + 3: Lessons and Assessments (both depend only on curriculum) ===
+        log.info("STEP 2+3: LESSON DESIGN & ASSESSMENT GENERATION (concurrent)")
+
         curriculum = curriculum_result['content'].get('curriculum', [])
-        all_lessons = []
-        
-        for week in curriculum[:2]:  # Limit to first 2 weeks for demo
-            week_num = week.get('week', 1)
-            lesson_input = {**teacher_input, 'curriculum': curriculum, 'week_number': week_num}
-            
-            lesson_result = await self.run_with_evaluation(generator_name="lesson", input_data=lesson_input, content_type="lesson", max_iterations=2)
-            all_lessons.extend(lesson_result['content'].get('lessons', []))
-        
-        results['lessons'] = all_lessons
-        
-        # === STEP 3: Assessment Generation with Evaluation ===
-        print("\n" + "="*60)
-        print("STEP 3: ASSESSMENT GENERATION")
-        print("="*60)
-        
+        self._encode("curriculum", curriculum)   # serialized once, spliced into every downstream input
+
+        # Assessments need only the curriculum, not the lessons, so both branches
+        # of the DAG run concurrently. Sheets writes are safe: each agent writes
+        # to its own range (curriculum_plan / lessons / assessments).
+        lessons_coro = self._run_all_weeks(teacher_input, curriculum)
+
         assessment_input = {**teacher_input, 'curriculum': curriculum, 'week_number': 1, 'assessment_type': 'quiz'}
-        assessment_result = await self.run_with_evaluation(generator_name="assessment", input_data=assessment_input, content_type="assessment", max_iterations=2)
+        assessment_coro = self.run_with_evaluation(generator_name="assessment", input_data=assessment_input, content_type="assessment", max_iterations=2)
+
+        all_lessons, assessment_result = await asyncio.gather(lessons_coro, assessment_coro)
+        results['lessons'] = all_lessons
         results['assessments'] = assessment_result
         
         # === STEP 4: Export (No evaluation needed) ===
-        print("\n" + "="*60)
-        print("STEP 4: EXPORT & ORGANIZATION")
-        print("="*60)
+        log.info("STEP 4: EXPORT & ORGANIZATION")
         
         export_input = {
             'curriculum': curriculum_result['content'],
@@ -363,9 +463,7 @@ class TutoBot:
         export_result = await self.run_agent("export", export_input)
         results['export'] = export_result
         
-        print(f"\n{'='*60}")
-        print("? PIPELINE COMPLETE")
-        print(f"{'='*60}\n")
+        log.info("PIPELINE COMPLETE")
         
         return results
 
@@ -1,58 +1,75 @@
 
-from sheets_helper import read_sheet, write_sheet
-from drive_helper import create_folder, upload_file
+import asyncio
 
-from agents import run_generation_pipeline
+# sheets/drive/agents pull in googleapiclient and the full ADK — imported
+# inside the functions so a run that finds no pending rows pays ~100ms of
+# startup instead of seconds
 
-def run_pipeline():
-    print("🔄 Checking Google Form submissions...")
-
-    df = read_sheet("form_responses")
-
-    # Add Status column if missing
-    if "Status" not in df.columns:
-        df["Status"] = ""
+MAX_CONCURRENT_TEACHERS = 3
 
-    pending_rows = df[df["Status"] != "Completed"]
 
-    if pending_rows.empty:
-        print("✨ No new form responses. All caught up!")
-        return
+async def _process_row(index, row, sem):
+    """Handle one pending form response end-to-end; returns the row update"""
+    from agents import TutoBot
+    from drive_helper import create_folder
+    from sheets_helper import SHEET_ID
 
-    for index, row in pending_rows.iterrows():
+    async with sem:
         teacher = row["Teacher Name"]
         print(f"⚡ Processing request by: {teacher}")
 
-        # Step 1 — Create a Drive folder for this teacher
-        folder_id = create_folder(teacher)
+        # Step 1 — Create a Drive folder for this teacher (blocking API call)
+        folder_id = await asyncio.to_thread(create_folder, teacher)
 
-        # Step 2 — Use the main agent to generate content
-        outputs = run_generation_pipeline(
-            grade=row["Grade / Class"],
-            subject=row["Subject"],
-            topics=row["Topics to Cover"],
-            weeks=row["Week Duration"],
-            classes_per_week=row["Classes per Week"]
-        )
+        # Step 2 — Run the full agent pipeline for this request; docs land
+        # directly in the teacher's folder
+        tut = TutoBot(SHEET_ID, folder_id, service_account_file="config/service_account.json")
+        teacher_input = {
+            "board": row.get("Board", "SSC"),
+            "grade": row["Grade / Class"],
+            "subject": row["Subject"],
+            "duration_weeks": row["Week Duration"],
+            "learning_goals": row["Topics to Cover"],
+            "classes_per_week": row["Classes per Week"],
+        }
+        results = await tut.run_full_pipeline(teacher_input)
+
+        generated_links = [lesson.get("doc_link", "") for lesson in results.get("lessons", [])]
 
-        uploaded_links = []
-        for file_path in outputs:
-            link = upload_file(file_path, folder_id)
-            uploaded_links.append(link)
+        print(f"🎉 Done: {teacher}")
 
-        # Step 3 — Write back to Sheet
-        write_sheet(
-            "form_responses",
+        # Step 3 — Queue the row update for one bulk write after the gather
+        return (
             index,
             {
                 "Status": "Completed",
                 "Drive Folder": f"https://drive.google.com/drive/folders/{folder_id}",
-                "Generated Files": ", ".join(uploaded_links)
-            }
+                "Generated Files": ", ".join(link for link in generated_links if link),
+            },
         )
 
-        print("🎉 Done!")
 
-if __name__ == "__main__":
-    run_pipeline()
+async def run_pipeline():
+    print("🔄 Checking Google Form submissions...")
 
+    from sheets_helper import read_sheet_records, batch_write_sheet
+
+    rows = read_sheet_records("form_responses")
+
+    pending_rows = [(index, row) for index, row in enumerate(rows) if row.get("Status") != "Completed"]
+
+    if not pending_rows:
+        print("✨ No new form responses. All caught up!")
+        return
+
+    # Teachers are independent — fan out, but cap concurrent pipelines so the
+    # per-teacher fan-outs don't stack into unbounded LLM traffic
+    sem = asyncio.Semaphore(MAX_CONCURRENT_TEACHERS)
+    pending_updates = await asyncio.gather(
+        *[_process_row(index, row, sem) for index, row in pending_rows]
+    )
+
+    batch_write_sheet("form_responses", list(pending_updates))
+
+if __name__ == "__main__":
+    asyncio.run(run_pipeline())
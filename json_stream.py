@@ -0,0 +1,196 @@
+"""
+TutoBot Streaming JSON Parser
+Single-pass extraction and repair of the JSON payload embedded in LLM output
+"""
+
+import json
+import re
+
+try:
+    import orjson   # 2-3x faster decode on large payloads; optional
+except ImportError:
+    orjson = None
+
+
+def _loads(text: str):
+    """Decode with orjson when installed, stdlib json otherwise.
+
+    Both raise json.JSONDecodeError on malformed input (orjson's error is a
+    subclass), so the repair fallback path is unaffected.
+    """
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+class StreamingJsonParser:
+    """
+    Incremental, repair-aware parser for JSON embedded in streamed LLM output.
+
+    Feed each text chunk to consume() as it arrives; the parser skips
+    markdown code fences and surrounding chatter on the fly, tracks string/
+    escape state and bracket depth, and captures exactly the root JSON value.
+    Call get() after the stream ends to obtain the parsed object. If the
+    captured value is malformed (trailing commas, Python None/True/False,
+    truncated output), get() repairs it in a single pass instead of throwing
+    the whole generation away and forcing a costly regeneration.
+    """
+
+    def __init__(self):
+        self._chunks = []         # raw chunks, kept for error reporting
+        self._json = []           # captured JSON characters
+        self._started = False     # seen the opening { or [
+        self._done = False        # root value closed
+        self._in_string = False
+        self._escaped = False
+        self._stack = []          # open brackets, innermost last
+
+    def consume(self, chunk: str) -> None:
+        """Feed one streamed text chunk to the parser"""
+        self._chunks.append(chunk)
+        if self._done:
+            return
+
+        for ch in chunk:
+            if not self._started:
+                # Prose, ``` fences and language tags before the JSON are chatter
+                if ch in '{[':
+                    self._started = True
+                    self._json.append(ch)
+                    self._stack.append(ch)
+                continue
+
+            self._json.append(ch)
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif ch == '\\':
+                    self._escaped = True
+                elif ch == '"':
+                    self._in_string = False
+            elif ch == '"':
+                self._in_string = True
+            elif ch in '{[':
+                self._stack.append(ch)
+            elif ch in '}]':
+                self._stack.pop()
+                if not self._stack:
+                    self._done = True
+                    break
+
+    @property
+    def buffer(self) -> str:
+        """Full raw text received so far (joined on demand)"""
+        return ''.join(self._chunks)
+
+    @property
+    def complete(self) -> bool:
+        """True once the root JSON value has been fully received"""
+        return self._done
+
+    def get(self):
+        """Parse and return the captured JSON value, repairing if needed
+
+        Raises:
+            ValueError: if no JSON value was found in the stream
+            json.JSONDecodeError: if the value is malformed beyond repair
+        """
+        if not self._started:
+            raise ValueError("No JSON value found in stream")
+        text = ''.join(self._json)
+        try:
+            return _loads(text)
+        except json.JSONDecodeError:
+            return _loads(self._repair(text))
+
+    def _repair(self, text: str) -> str:
+        """Single-pass repair: Python literals, trailing commas, truncation"""
+        out = []
+        in_string = False
+        escaped = False
+        pending_comma = False   # emitted only if real content follows
+        i = 0
+        n = len(text)
+
+        while i < n:
+            ch = text[i]
+            if in_string:
+                out.append(ch)
+                if escaped:
+                    escaped = False
+                elif ch == '\\':
+                    escaped = True
+                elif ch == '"':
+                    in_string = False
+                i += 1
+                continue
+            if ch == '"':
+                if pending_comma:
+                    out.append(',')
+                    pending_comma = False
+                out.append(ch)
+                in_string = True
+                i += 1
+                continue
+            if ch == ',':
+                if pending_comma:
+                    out.append(',')
+                pending_comma = True
+                i += 1
+                continue
+            if ch in '}]':
+                # Comma directly before a closing bracket is dropped
+                pending_comma = False
+                out.append(ch)
+                i += 1
+                continue
+            if ch.isspace():
+                out.append(ch)
+                i += 1
+                continue
+            if pending_comma:
+                out.append(',')
+                pending_comma = False
+            # Map Python literals the model sometimes emits
+            for literal, replacement in (('None', 'null'), ('True', 'true'), ('False', 'false')):
+                if text.startswith(literal, i):
+                    out.append(replacement)
+                    i += len(literal)
+                    break
+            else:
+                out.append(ch)
+                i += 1
+
+        repaired = ''.join(out)
+
+        if not self._done:
+            # Truncated stream: close the open string, finish or drop the
+            # partial trailing token, then auto-close the bracket stack
+            if in_string:
+                if escaped:
+                    repaired = repaired[:-1]
+                repaired += '"'
+            repaired = repaired.rstrip().rstrip(',')
+            repaired = repaired.rstrip('+-.')   # partial number punctuation
+            tail = re.search(r'[A-Za-z]+$', repaired)
+            if tail:
+                for literal in ('null', 'true', 'false'):
+                    if literal.startswith(tail.group()):
+                        repaired += literal[len(tail.group()):]
+                        break
+                else:
+                    repaired = repaired[:tail.start()].rstrip().rstrip(',')
+            repaired += ''.join('}' if b == '{' else ']' for b in reversed(self._stack))
+
+        return repaired
+
+
+def repair_json_stream(text: str):
+    """Parse (and repair if needed) a complete LLM output string
+
+    Convenience wrapper that feeds the whole text through StreamingJsonParser,
+    for callers that already hold the full response.
+    """
+    parser = StreamingJsonParser()
+    parser.consume(text)
+    return parser.get()
@@ -4,6 +4,9 @@ All agent instructions stored as dictionary for easy management
 In production, these would be loaded from .md files
 """
 
+import types
+import functools
+
 PROMPTS = {
     "planner": """You are an expert curriculum planner for Indian education.
 
@@ -282,10 +285,13 @@ RULES:
 - If status is REJECTED, the feedback must be actionable for the Generator to fix the issues in the next run.
 """
 
+# Freeze so mutation can't silently invalidate the get_prompt cache
+PROMPTS = types.MappingProxyType(PROMPTS)
 
 
+@functools.lru_cache(maxsize=None)
 def get_prompt(name: str) -> str:
-    """Get prompt by name"""
+    """Get prompt by name (memoized — prompts are immutable after import)"""
     if name not in PROMPTS:
         raise ValueError(f"Prompt '{name}' not found. Available: {list(PROMPTS.keys())}")
     return PROMPTS[name]
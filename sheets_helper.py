@@ -1,49 +1,182 @@
 
+import functools
+
 from google.oauth2.service_account import Credentials
 from googleapiclient.discovery import build
-import pandas as pd
 
 SCOPES = ["https://www.googleapis.com/auth/spreadsheets"]
 CREDS = Credentials.from_service_account_file(
     "config/service_account.json", scopes=SCOPES
 )
 
-def read_sheet(sheet_name):
-    service = build("sheets", "v4", credentials=CREDS)
-    sheet_id = "<YOUR_GOOGLE_SHEET_ID>"
-    
+SHEET_ID = "1KxTGp_dw6dFZwekks-JkVeaTqOWyuqjuz6dafEzk4R8"
+
+
+@functools.lru_cache(maxsize=1)
+def _service():
+    """Shared Sheets service — built once, discovery document parsed once"""
+    return build(
+        "sheets", "v4", credentials=CREDS,
+        cache_discovery=False, static_discovery=True,
+    )
+
+def read_sheet_raw(sheet_name, service=None):
+    """Read a sheet as plain (header, rows) lists — no DataFrame overhead"""
     result = (
-        service.spreadsheets()
+        (service or _service()).spreadsheets()
         .values()
-        .get(spreadsheetId=sheet_id, range=sheet_name)
+        .get(spreadsheetId=SHEET_ID, range=sheet_name, fields="values")
         .execute()
     )
 
     values = result.get("values", [])
     if not values:
+        return [], []
+
+    return values[0], values[1:]
+
+
+def read_sheet_columns(sheet_name, columns, service=None):
+    """Fetch only the named columns as {name: list of cell values}.
+
+    Resolves each name to its A1 letter range via the cached header and
+    pulls all ranges in one batchGet — bandwidth stays proportional to the
+    columns asked for, not the whole sheet.
+    """
+    header = _header_map(sheet_name)
+    ranges = [
+        f"{sheet_name}!{chr(header[name] + 65)}2:{chr(header[name] + 65)}"
+        for name in columns
+    ]
+    result = (
+        (service or _service()).spreadsheets()
+        .values()
+        .batchGet(spreadsheetId=SHEET_ID, ranges=ranges, fields="valueRanges.values")
+        .execute()
+    )
+    return {
+        name: [row[0] if row else None for row in value_range.get("values", [])]
+        for name, value_range in zip(columns, result.get("valueRanges", []))
+    }
+
+
+def read_sheet(sheet_name, service=None, dtypes=None, columns=None):
+    """Read a sheet as a DataFrame (thin wrapper over read_sheet_raw).
+
+    Optionally pass dtypes (a column-name -> dtype mapping) to get typed
+    columns; by default every column stays object, skipping pandas'
+    per-column dtype re-inference over the list-of-lists. Passing columns
+    fetches only those columns (see read_sheet_columns) instead of the
+    whole sheet.
+    """
+    import numpy as np
+    import pandas as pd   # lazy: only DataFrame callers pay the pandas import
+
+    if columns:
+        data = read_sheet_columns(sheet_name, columns, service=service)
+        length = max(map(len, data.values()), default=0)
+        df = pd.DataFrame(
+            {name: cells + [None] * (length - len(cells)) for name, cells in data.items()}
+        )
+        if dtypes:
+            df = df.astype(dtypes, copy=False)
+        return df
+
+    header, rows = read_sheet_raw(sheet_name, service=service)
+    if not header:
         return pd.DataFrame()
 
-    df = pd.DataFrame(values[1:], columns=values[0])
+    # The values API drops trailing empty cells, so pad ragged rows and hand
+    # pandas one rectangular object array instead of a list-of-lists
+    width = len(header)
+    rows = [(row + [None] * (width - len(row)))[:width] if len(row) != width else row for row in rows]
+    arr = np.array(rows, dtype=object).reshape(-1, width)
+
+    df = pd.DataFrame(arr, columns=header, copy=False)
+    if dtypes:
+        df = df.astype(dtypes, copy=False)
     return df
 
 
-def write_sheet(sheet_name, row_index, data_dict):
-    service = build("sheets", "v4", credentials=CREDS)
-    sheet_id =  "1KxTGp_dw6dFZwekks-JkVeaTqOWyuqjuz6dafEzk4R8"
+def read_sheet_records(sheet_name, service=None):
+    """Read a sheet as a list of row dicts keyed by the header row.
+
+    Lighter than read_sheet for callers that only traverse rows — no pandas
+    DataFrame construction. Short rows simply omit their trailing keys.
+    """
+    header, rows = read_sheet_raw(sheet_name, service=service)
+    return [dict(zip(header, row)) for row in rows]
+
+
+def write_sheet(sheet_name, row_index, data_dict, service=None):
+    service = service or _service()
+    columns = _header_map(sheet_name)
 
+    data = []
     for col_name, new_value in data_dict.items():
-        col_number = find_column_index(sheet_name, col_name)
-        cell = chr(col_number + 65) + str(row_index + 2)
+        cell = chr(columns[col_name] + 65) + str(row_index + 2)
+        data.append({"range": f"{sheet_name}!{cell}", "values": [[new_value]]})
+
+    service.spreadsheets().values().batchUpdate(
+        spreadsheetId=SHEET_ID,
+        body={"valueInputOption": "RAW", "data": data},
+    ).execute()
+
+
+def batch_write_sheet(sheet_name, updates, service=None):
+    """Apply many (row_index, data_dict) updates in one batchUpdate call.
+
+    Same per-pair semantics as write_sheet, but all cells go out in a single
+    API request instead of one round-trip per cell.
+    """
+    if not updates:
+        return
+
+    service = service or _service()
+    columns = _header_map(sheet_name)
+
+    data = []
+    for row_index, data_dict in updates:
+        for col_name, new_value in data_dict.items():
+            cell = chr(columns[col_name] + 65) + str(row_index + 2)
+            data.append({"range": f"{sheet_name}!{cell}", "values": [[new_value]]})
+
+    service.spreadsheets().values().batchUpdate(
+        spreadsheetId=SHEET_ID,
+        body={"valueInputOption": "RAW", "data": data},
+    ).execute()
+
+
+# Column indices by header name, per sheet. Populated lazily from a
+# header-row-only fetch; explicit (rather than lru_cache) so callers that
+# mutate a sheet's schema can invalidate it.
+_HEADER_CACHE = {}
+
+
+def _header_map(sheet_name):
+    cached = _HEADER_CACHE.get(sheet_name)
+    if cached is None:
+        result = (
+            _service().spreadsheets()
+            .values()
+            .get(spreadsheetId=SHEET_ID, range=f"{sheet_name}!1:1", fields="values")
+            .execute()
+        )
+        values = result.get("values", [])
+        header = values[0] if values else []
+        cached = {name: index for index, name in enumerate(header)}
+        _HEADER_CACHE[sheet_name] = cached
+    return cached
+
 
-        service.spreadsheets().values().update(
-            spreadsheetId=sheet_id,
-            range=f"{sheet_name}!{cell}",
-            valueInputOption="RAW",
-            body={"values": [[new_value]]},
-        ).execute()
+def invalidate_header_cache(sheet_name=None):
+    """Drop cached headers after a schema change (all sheets when None)"""
+    if sheet_name is None:
+        _HEADER_CACHE.clear()
+    else:
+        _HEADER_CACHE.pop(sheet_name, None)
 
 
 def find_column_index(sheet_name, col_name):
-    df = read_sheet(sheet_name)
-    return list(df.columns).index(col_name)
+    return _header_map(sheet_name)[col_name]
 
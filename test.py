@@ -8,10 +8,13 @@ import argparse
 import json
 from typing import Dict, List, Any, Optional
 
-from agents import TutoBot
+# agents pulls in the full ADK stack (seconds of import time) — imported
+# inside each mode so --help and argument errors return instantly
 
 async def test_planner(spreadsheet_id: str, teacher_input: Dict[str, Any]):
     """Test Planner agent with evaluation loop"""
+    from agents import TutoBot
+
     tut = TutoBot(spreadsheet_id)
     
     teacher_input['spreadsheet_id'] = spreadsheet_id
@@ -29,6 +32,8 @@ async def test_planner(spreadsheet_id: str, teacher_input: Dict[str, Any]):
 
 async def test_lesson(spreadsheet_id: str, folder_id: str, teacher_input: Dict[str, Any]):
     """Test Lesson agent with evaluation loop"""
+    from agents import TutoBot
+
     tut = TutoBot(spreadsheet_id, folder_id)
     
     # First generate curriculum
@@ -58,7 +63,8 @@ def main():
     parser.add_argument("--subject", default="Mathematics", help="Subject to teach")
     parser.add_argument("--weeks", type=int, default=2, help="Duration in weeks")
     parser.add_argument("--goals", default="Master fractions and decimals", help="Learning goals")
-    
+    parser.add_argument("--quiet", action="store_true", help="Skip the startup banner")
+
     args = parser.parse_args()
     
     teacher_input = {
@@ -69,21 +75,23 @@ def main():
         "learning_goals": args.goals
     }
     
-    print(f"""
+    if not args.quiet:
+        print(f"""
 ╔══════════════════════════════════════════════════════════════╗
 ║                   🎓 TutoBot Starting 🎓                     ║
 ╟──────────────────────────────────────────────────────────────╢
 ║  Board:     {args.board:<48} ║
 ║  Grade:     {args.grade:<48} ║
 ║  Subject:   {args.subject:<48} ║
-║  Duration:  {args.weeks} weeks{' ' * (44 - len(str(args.weeks)))}║
-║  Sheet ID:  {args.spreadsheet_id[:20]}...{' ' * 27}║
+║  Duration:  {f'{args.weeks} weeks':<48} ║
+║  Sheet ID:  {args.spreadsheet_id[:20] + '...':<48} ║
 ║  Mode:      {args.mode:<48} ║
 ╚══════════════════════════════════════════════════════════════╝
     """)
     
     if args.mode == "full":
         print("\n🚀 Running FULL PIPELINE (with evaluation loops)...\n")
+        from agents import TutoBot
         tutobot = TutoBot(args.spreadsheet_id, args.folder_id)
         asyncio.run(tutobot.run_full_pipeline(teacher_input))
     
@@ -3,8 +3,14 @@ TutoBot Custom Tools
 Integrates with Google Workspace APIs and NCERT content
 """
 
+import asyncio
 import json
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any, Optional
+import google_auth_httplib2
+import httplib2
 from google.oauth2 import service_account
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
@@ -18,15 +24,47 @@ SCOPES = [
     'https://www.googleapis.com/auth/drive'
 ]
 
+@functools.lru_cache(maxsize=4)
+def _load_creds(service_account_file: str):
+    """Key parsing and RSA setup happen once per key file, process-wide"""
+    return service_account.Credentials.from_service_account_file(service_account_file, scopes=SCOPES)
+
+
 class GoogleWorkspaceTools:
     """Unified Google Workspace API client"""
-    
+
     def __init__(self, service_account_file: str):
-        self.creds = service_account.Credentials.from_service_account_file(service_account_file, scopes=SCOPES)
-        self.sheets_service = build('sheets', 'v4', credentials=self.creds)
-        self.docs_service = build('docs', 'v1', credentials=self.creds)
-        self.forms_service = build('forms', 'v1', credentials=self.creds)
-        self.drive_service = build('drive', 'v3', credentials=self.creds)
+        # static_discovery avoids fetching the discovery document over HTTP;
+        # cache_discovery=False skips the on-disk cache lookup
+        self.creds = _load_creds(service_account_file)
+        # One authorized transport shared by all four services: httplib2
+        # keeps its TLS connections alive per-Http instance, so consecutive
+        # calls reuse the pool instead of re-handshaking every time
+        self.http = google_auth_httplib2.AuthorizedHttp(self.creds, http=httplib2.Http())
+        self.sheets_service = build('sheets', 'v4', http=self.http, cache_discovery=False, static_discovery=True)
+        self.docs_service = build('docs', 'v1', http=self.http, cache_discovery=False, static_discovery=True)
+        self.forms_service = build('forms', 'v1', http=self.http, cache_discovery=False, static_discovery=True)
+        self.drive_service = build('drive', 'v3', http=self.http, cache_discovery=False, static_discovery=True)
+
+
+_LOCAL = threading.local()
+
+
+def _get_tools(service_account_file: str) -> GoogleWorkspaceTools:
+    """Cached client per (thread, service account file).
+
+    Building the client does RSA setup and constructs four services — far
+    too expensive to repeat on every tool call. The cache is per-thread
+    because the shared httplib2 transport inside each client is not
+    thread-safe; credentials themselves are shared process-wide.
+    """
+    cache = getattr(_LOCAL, 'tools', None)
+    if cache is None:
+        cache = _LOCAL.tools = {}
+    tools = cache.get(service_account_file)
+    if tools is None:
+        tools = cache[service_account_file] = GoogleWorkspaceTools(service_account_file)
+    return tools
 
 
 # ========== Google Sheets Tools ==========
@@ -44,8 +82,8 @@ def sheets_read(spreadsheet_id: str, range_name: str, service_account_file: str
         List of rows, each row is a list of cell values
     """
     try:
-        tools = GoogleWorkspaceTools(service_account_file)
-        result = tools.sheets_service.spreadsheets().values().get(spreadsheetId=spreadsheet_id, range=range_name).execute()
+        tools = _get_tools(service_account_file)
+        result = tools.sheets_service.spreadsheets().values().get(spreadsheetId=spreadsheet_id, range=range_name, fields='values').execute()
         return result.get('values', [])
     except HttpError as e:
         print(f"Sheets read error: {e}")
@@ -66,7 +104,7 @@ def sheets_write(spreadsheet_id: str, range_name: str, values: List[List[Any]],
         True if successful, False otherwise
     """
     try:
-        tools = GoogleWorkspaceTools(service_account_file)
+        tools = _get_tools(service_account_file)
         body = {'values': values}
         tools.sheets_service.spreadsheets().values().update(spreadsheetId=spreadsheet_id, range=range_name, valueInputOption='RAW', body=body).execute()
         return True
@@ -89,7 +127,7 @@ def sheets_append(spreadsheet_id: str, range_name: str, values: List[List[Any]],
         True if successful, False otherwise
     """
     try:
-        tools = GoogleWorkspaceTools(service_account_file)
+        tools = _get_tools(service_account_file)
         body = {'values': values}
         tools.sheets_service.spreadsheets().values().append(spreadsheetId=spreadsheet_id, range=range_name,
             valueInputOption='RAW', insertDataOption='INSERT_ROWS', body=body).execute()
@@ -156,52 +194,71 @@ NCERT_CONTENT_DB = {
 }
 
 
+def _index_ncert_db():
+    """Precompute lowercase fields and lookup buckets for the NCERT DB.
+
+    Entries are (subject_lc, topics_lc, content) tuples bucketed two ways:
+    by exact (grade, subject_lc) key for O(1) hits, and by grade alone for
+    the substring fallback. Built once at import so per-call search never
+    re-lowercases the same DB strings.
+    """
+    exact = {}
+    by_grade = {}
+    for content in NCERT_CONTENT_DB.values():
+        entry = (content['subject'].lower(), tuple(t.lower() for t in content['topics']), content)
+        exact.setdefault((content['grade'], entry[0]), []).append(entry)
+        by_grade.setdefault(content['grade'], []).append(entry)
+    return exact, by_grade
+
+
+_NCERT_INDEX, _NCERT_BY_GRADE = _index_ncert_db()
+
+
 def search_ncert_content(grade: int, subject: str, topic: str) -> Dict[str, Any]:
     """
     Search NCERT content database for relevant educational material
-    
+
     Args:
         grade: Student grade level (1-12)
         subject: Subject name (Mathematics, Science, etc.)
         topic: Topic to search for
-        
+
     Returns:
         Dictionary with chapter information, concepts, and examples
     """
     # Normalize inputs
     subject = subject.lower().strip()
     topic = topic.lower().strip()
-    
-    # Search through database
-    results = []
-    for key, content in NCERT_CONTENT_DB.items():
-        if (content['grade'] == grade and 
-            subject in content['subject'].lower() and
-            any(topic in t.lower() for t in content['topics'])):
-            results.append(content)
-    
-    if results:
-        # Return the most relevant match
-        return results[0]
-    else:
-        # Return empty structure if no match
-        return {
-            "grade": grade,
-            "subject": subject,
-            "chapter": f"Content for {topic} not found in database",
-            "topics": [],
-            "content_summary": f"Please manually add NCERT content for Grade {grade} {subject} - {topic}",
-            "key_concepts": [],
-            "example_problems": []
-        }
+
+    # O(1) bucket hit for an exact subject; fall back to scanning the grade
+    # bucket to keep the original substring semantics ("math" matches
+    # "Mathematics")
+    candidates = _NCERT_INDEX.get((grade, subject))
+    if candidates is None:
+        candidates = [entry for entry in _NCERT_BY_GRADE.get(grade, ()) if subject in entry[0]]
+
+    for subject_lc, topics_lc, content in candidates:
+        if any(topic in t for t in topics_lc):
+            # Return the most relevant match
+            return content
+
+    # Return empty structure if no match
+    return {
+        "grade": grade,
+        "subject": subject,
+        "chapter": f"Content for {topic} not found in database",
+        "topics": [],
+        "content_summary": f"Please manually add NCERT content for Grade {grade} {subject} - {topic}",
+        "key_concepts": [],
+        "example_problems": []
+    }
 
 
 # ========== Google Docs Tool ==========
 
-# '''
 def create_google_doc(title: str, content: str, folder_id: Optional[str] = None, service_account_file: str = '../service_account.json') -> str:
     try:
-        tools = GoogleWorkspaceTools(service_account_file)
+        tools = _get_tools(service_account_file)
 
         # 1. Prepare file metadata (Define folder immediately)
         file_metadata = {'name': title, 'mimeType': 'application/vnd.google-apps.document'}
@@ -212,7 +269,7 @@ def create_google_doc(title: str, content: str, folder_id: Optional[str] = None,
 
         # 2. Create the file using DRIVE API (Not Docs API)
         # This ensures it is born inside the folder.
-        doc = tools.drive_service.files().create(body=file_metadata).execute()
+        doc = tools.drive_service.files().create(body=file_metadata, fields='id').execute()
         doc_id = doc.get('id')
 
         # 3. Insert content (Now we use the Docs API)
@@ -224,47 +281,47 @@ def create_google_doc(title: str, content: str, folder_id: Optional[str] = None,
     except HttpError as e:
         print(f"Google Docs error: {e}")
         return ""
-'''
-def create_google_doc(title: str, content: str, folder_id: str, service_account_file: str = '../service_account.json') -> str:
-    """
-    Create a Google Doc with formatted content
-    
-    Args:
-        title: Document title
-        content: Text content to insert
-        folder_id: Optional Drive folder ID to store document
-        service_account_file: Path to service account JSON
-        
-    Returns:
-        Document URL or empty string on error
-    """
-    try:
-        tools = GoogleWorkspaceTools(service_account_file)
-        
-        # Create document
-        doc = tools.docs_service.documents().create(body={'title': title}).execute()
-        doc_id = doc.get('documentId')
-        
-        # Insert content
-        requests = [{'insertText': {'location': {'index': 1}, 'text': content}}]
-        tools.docs_service.documents().batchUpdate(documentId=doc_id, body={'requests': requests}).execute()
-        
-        # Move to folder if specified
-        if folder_id:
-            file = tools.drive_service.files().get(fileId=doc_id, fields='parents').execute()
-            previous_parents = ",".join(file.get('parents', []))
-            tools.drive_service.files().update(fileId=doc_id, addParents=folder_id, removeParents=previous_parents, fields='id, parents').execute()
-        
-        return f"https://docs.google.com/document/d/{doc_id}/edit"
-    
-    except HttpError as e:
-        print(f"Google Docs error: {e}")
-        return ""
-'''
 
 
 # ========== Google Forms Tool ==========
 
+def _base_question(q: Dict[str, Any]) -> Dict[str, Any]:
+    """Shared skeleton for a graded form question"""
+    return {
+        "title": q['question'],
+        "questionItem": {
+            "question": {
+                "required": True,
+                "grading": {
+                    "pointValue": q.get('points', 1),
+                    "correctAnswers": {"answers": [{"value": q['correct_answer']}]}
+                }
+            }
+        }
+    }
+
+
+def _mc_item(q: Dict[str, Any]) -> Dict[str, Any]:
+    item = _base_question(q)
+    item['questionItem']['question']['choiceQuestion'] = {
+        "type": "RADIO",
+        "options": [{"value": opt} for opt in q.get('options', [])]
+    }
+    return item
+
+
+def _sa_item(q: Dict[str, Any]) -> Dict[str, Any]:
+    item = _base_question(q)
+    item['questionItem']['question']['textQuestion'] = {"paragraph": False}
+    return item
+
+
+_TYPE_DISPATCH = {
+    'MULTIPLE_CHOICE': _mc_item,
+    'SHORT_ANSWER': _sa_item,
+}
+
+
 def create_google_form(title: str, questions: List[Dict[str, Any]], 
                        service_account_file: str = '../service_account.json') -> str:
     """
@@ -286,37 +343,21 @@ def create_google_form(title: str, questions: List[Dict[str, Any]],
         Form URL or empty string on error
     """
     try:
-        tools = GoogleWorkspaceTools(service_account_file)
+        tools = _get_tools(service_account_file)
         
         # Create form
         form = {"info": {"title": title, "documentTitle": title}}
-        result = tools.forms_service.forms().create(body=form).execute()
+        result = tools.forms_service.forms().create(body=form, fields='formId').execute()
         form_id = result.get('formId')
         
         # Enable quiz mode
         update_requests = [{"updateSettings": {"settings": {"quizSettings": {"isQuiz": True}}, "updateMask": "quizSettings.isQuiz"}}]
         
-        # Add questions
+        # Add questions — dict shape per type lives in the module-level
+        # factories, dispatched by type instead of chained string compares
         for i, q in enumerate(questions):
-            question_item = {
-                "title": q['question'],
-                "questionItem": {
-                    "question": {
-                        "required": True,
-                        "grading": {
-                            "pointValue": q.get('points', 1),
-                            "correctAnswers": {"answers": [{"value": q['correct_answer']}]}
-                        }
-                    }
-                }
-            }
-            
-            if q['type'] == 'MULTIPLE_CHOICE':
-                question_item['questionItem']['question']['choiceQuestion'] = {"type": "RADIO", "options": [{"value": opt} for opt in q.get('options', [])]}
-            elif q['type'] == 'SHORT_ANSWER':
-                question_item['questionItem']['question']['textQuestion'] = {"paragraph": False}
-            
-            update_requests.append({"createItem": {"item": question_item, "location": {"index": i}}})
+            build_item = _TYPE_DISPATCH.get(q['type'], _base_question)
+            update_requests.append({"createItem": {"item": build_item(q), "location": {"index": i}}})
         
         # Apply all updates
         tools.forms_service.forms().batchUpdate(formId=form_id, body={"requests": update_requests}).execute()
@@ -328,6 +369,44 @@ def create_google_form(title: str, questions: List[Dict[str, Any]],
         return ""
 
 
+# ========== Async Wrappers ==========
+
+# The Workspace calls above are blocking httplib2 I/O; run on the event loop
+# they would stall LLM streaming for their full round-trip. These wrappers
+# push them onto a shared pool so orchestration code can await (and gather)
+# them. Each worker thread builds its own services via _get_tools.
+_TOOL_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix='gws-tool')
+
+
+def _in_pool(func, *args, **kwargs):
+    return asyncio.get_running_loop().run_in_executor(_TOOL_POOL, functools.partial(func, *args, **kwargs))
+
+
+async def sheets_read_async(spreadsheet_id: str, range_name: str, service_account_file: str = '../service_account.json') -> List[List[Any]]:
+    """Async counterpart of sheets_read (runs on the tool thread pool)"""
+    return await _in_pool(sheets_read, spreadsheet_id, range_name, service_account_file)
+
+
+async def sheets_write_async(spreadsheet_id: str, range_name: str, values: List[List[Any]], service_account_file: str = '../service_account.json') -> bool:
+    """Async counterpart of sheets_write (runs on the tool thread pool)"""
+    return await _in_pool(sheets_write, spreadsheet_id, range_name, values, service_account_file)
+
+
+async def sheets_append_async(spreadsheet_id: str, range_name: str, values: List[List[Any]], service_account_file: str = '../service_account.json') -> bool:
+    """Async counterpart of sheets_append (runs on the tool thread pool)"""
+    return await _in_pool(sheets_append, spreadsheet_id, range_name, values, service_account_file)
+
+
+async def create_google_doc_async(title: str, content: str, folder_id: Optional[str] = None, service_account_file: str = '../service_account.json') -> str:
+    """Async counterpart of create_google_doc (runs on the tool thread pool)"""
+    return await _in_pool(create_google_doc, title, content, folder_id, service_account_file)
+
+
+async def create_google_form_async(title: str, questions: List[Dict[str, Any]], service_account_file: str = '../service_account.json') -> str:
+    """Async counterpart of create_google_form (runs on the tool thread pool)"""
+    return await _in_pool(create_google_form, title, questions, service_account_file)
+
+
 # ========== Tool Registry for ADK ==========
 
 def get_all_tools():
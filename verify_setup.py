@@ -3,6 +3,7 @@ TutoBot Setup Verification Script
 Tests Google Workspace API access and service account configuration
 """
 
+import functools
 import os
 import sys
 from google.oauth2 import service_account
@@ -10,6 +11,15 @@ from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 
 
+@functools.lru_cache(maxsize=None)
+def _load_creds(*scopes):
+    """Load the service account key once per scope set — parsing and
+    validating the JSON key is not free, and every check needs it"""
+    return service_account.Credentials.from_service_account_file(
+        'config/service_account.json', scopes=list(scopes) or None
+    )
+
+
 def check_service_account():
     """Verify service account JSON exists and is valid"""
     print("🔍 Checking service account configuration...")
@@ -20,10 +30,7 @@ def check_service_account():
         return False
     
     try:
-        creds = service_account.Credentials.from_service_account_file(
-            'config/service_account.json',
-            scopes=['https://www.googleapis.com/auth/spreadsheets.readonly']
-        )
+        creds = _load_creds('https://www.googleapis.com/auth/spreadsheets.readonly')
         print(f"✅ Service account loaded: {creds.service_account_email}")
         return True
     except Exception as e:
@@ -36,15 +43,15 @@ def check_sheets_api(spreadsheet_id):
     print("\n🔍 Testing Google Sheets API access...")
     
     try:
-        creds = service_account.Credentials.from_service_account_file(
-            'config/service_account.json',
-            scopes=['https://www.googleapis.com/auth/spreadsheets']
-        )
-        
+        creds = _load_creds('https://www.googleapis.com/auth/spreadsheets')
+
         service = build('sheets', 'v4', credentials=creds)
         
         # Try to read from the spreadsheet
-        result = service.spreadsheets().get(spreadsheetId=spreadsheet_id).execute()
+        result = service.spreadsheets().get(
+            spreadsheetId=spreadsheet_id,
+            fields='properties.title,sheets.properties.title'
+        ).execute()
         print(f"✅ Successfully accessed spreadsheet: {result.get('properties', {}).get('title', 'Unknown')}")
         
         # List sheets
@@ -63,8 +70,7 @@ def check_sheets_api(spreadsheet_id):
         elif e.resp.status == 403:
             print(f"❌ Permission denied")
             print("   Make sure you shared the spreadsheet with:")
-            creds = service_account.Credentials.from_service_account_file('config/service_account.json')
-            print(f"   {creds.service_account_email}")
+            print(f"   {_load_creds().service_account_email}")
         else:
             print(f"❌ Error accessing Sheets API: {e}")
         return False
@@ -78,11 +84,8 @@ def check_docs_api():
     print("\n🔍 Testing Google Docs API access...")
     
     try:
-        creds = service_account.Credentials.from_service_account_file(
-            'config/service_account.json',
-            scopes=['https://www.googleapis.com/auth/documents']
-        )
-        
+        creds = _load_creds('https://www.googleapis.com/auth/documents')
+
         service = build('docs', 'v1', credentials=creds)
         print("✅ Google Docs API accessible")
         return True
@@ -98,11 +101,8 @@ def check_forms_api():
     print("\n🔍 Testing Google Forms API access...")
     
     try:
-        creds = service_account.Credentials.from_service_account_file(
-            'config/service_account.json',
-            scopes=['https://www.googleapis.com/auth/forms.body']
-        )
-        
+        creds = _load_creds('https://www.googleapis.com/auth/forms.body')
+
         service = build('forms', 'v1', credentials=creds)
         print("✅ Google Forms API accessible")
         return True
@@ -121,7 +121,8 @@ def main():
     """)
     
     # Check service account
-    if not check_service_account():
+    account_ok = check_service_account()
+    if not account_ok:
         print("\n❌ Setup incomplete. Please fix the service account configuration.")
         sys.exit(1)
     
@@ -144,7 +145,7 @@ def main():
     print("\n" + "="*60)
     print("📊 VERIFICATION SUMMARY")
     print("="*60)
-    print(f"Service Account:  {'✅ OK' if check_service_account() else '❌ FAIL'}")
+    print(f"Service Account:  {'✅ OK' if account_ok else '❌ FAIL'}")
     print(f"Google Sheets:    {'✅ OK' if sheets_ok else '❌ FAIL'}")
     print(f"Google Docs:      {'✅ OK' if docs_ok else '❌ FAIL'}")
     print(f"Google Forms:     {'✅ OK' if forms_ok else '❌ FAIL'}")